@@ -38,9 +38,9 @@ def get_database_objects(ssh: SSHClient, db_config: Dict[str, str]) -> List[str]
     try:
         stdin, stdout, stderr = ssh.exec_command(objects_cmd)
         output = stdout.read().decode('utf-8').strip()
-        error = stderr.read().decode('utf-8').strip()
         
-        if error and 'Warning' not in error:
+        if stdout.channel.recv_exit_status() != 0:
+            error = stderr.read().decode('utf-8').strip()
             print(f"{RED}Error getting database objects: {error}{NC}")
             return []
         
@@ -255,7 +255,9 @@ def create_new_backup(ssh: SSHClient, db_config: Dict[str, str]) -> Optional[str
             )
             
         try:
-            size = file_info.split()[4]
+            # Size is always the fifth column; the date columns that follow
+            # vary with locale and --time-style, so they are not parsed
+            size = file_info.split(maxsplit=5)[4]
             print(f"\n{GREEN}{ICONS['check']} Backup created successfully "
                   f"at {ICONS['folder']} {remote_path} (Size: {size}){NC}\n")
             return remote_path
@@ -44,7 +44,8 @@ SSH_CONFIG = {
     'HOST': None,
     'USER': None,
     'PASSWORD': None,
-    'KEY_PATH': None
+    'KEY_PATH': None,
+    'SKIP_HOST_KEYS': False
 }
 
 def load_yml_config() -> Optional[Dict[str, Any]]:
@@ -151,6 +152,17 @@ def validate_config() -> List[str]:
         
     return missing_vars
 
+def _parse_flag(value: Any) -> bool:
+    """Interpret a YAML boolean or a quoted "true"/"1"/"yes" string as a flag.
+
+    Args:
+        value: Raw configuration value
+
+    Returns:
+        bool: True only for an explicit yes; "false", "0" and missing values are False
+    """
+    return str(value).strip().lower() in ('1', 'true', 'yes')
+
 def merge_config(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
     """Merge two configuration dictionaries.
 
@@ -241,7 +253,8 @@ def select_configuration() -> bool:
                         'HOST': selected_config['config'].get('SSH_HOST'),
                         'USER': selected_config['config'].get('SSH_USER'),
                         'PASSWORD': selected_config['config'].get('SSH_PASSWORD'),
-                        'KEY_PATH': selected_config['config'].get('SSH_KEY_PATH')
+                        'KEY_PATH': selected_config['config'].get('SSH_KEY_PATH'),
+                        'SKIP_HOST_KEYS': _parse_flag(selected_config['config'].get('SSH_SKIP_HOST_KEYS'))
                     }
                     
                     global DB_CONFIG, SSH_CONFIG
@@ -11,6 +11,7 @@ from mysql_sync_manager.exceptions import (
     RestoreError
 )
 from mysql_sync_manager.retry_utils import with_retry, RetryContext
+from mysql_sync_manager.ssh import run_many
 
 @with_retry(retries=2, delay=1.0)
 def get_mysql_info(db_config: Dict[str, str], server_type: str = 'import', ssh: Optional[SSHClient] = None) -> Tuple[Optional[str], bool]:
@@ -49,26 +50,29 @@ def get_mysql_info(db_config: Dict[str, str], server_type: str = 'import', ssh:
             # Execute on remote server via SSH
             mysql_cmd = f"mysql -h {host} -u{user} -p'{password}' {database}"
             
+            # The four queries are independent, so they run concurrently on
+            # one SSH transport instead of costing a round trip each
+            version_output, vars_output, grants_output, db_size_output = run_many(ssh, [
+                f"{mysql_cmd} -e 'SELECT VERSION()'",
+                f"{mysql_cmd} -e 'SHOW VARIABLES WHERE Variable_name IN "
+                f"(\"max_allowed_packet\", \"wait_timeout\", "
+                f"\"character_set_server\", \"collation_server\")'",
+                f"{mysql_cmd} -e 'SHOW GRANTS'",
+                f"{mysql_cmd} -e 'SELECT ROUND(SUM(data_length + index_length) / 1024 / 1024, 1) "
+                f"AS size FROM information_schema.tables WHERE table_schema = \"{database}\"'"
+            ])
+
             # Get version
-            stdin, stdout, stderr = ssh.exec_command(f"{mysql_cmd} -e 'SELECT VERSION()'")
-            version_output = stdout.read().decode('utf-8').strip()
             version = version_output.split('\n')[-1].strip()
 
             # Get variables
-            stdin, stdout, stderr = ssh.exec_command(
-                f"{mysql_cmd} -e 'SHOW VARIABLES WHERE Variable_name IN "
-                f"(\"max_allowed_packet\", \"wait_timeout\", "
-                f"\"character_set_server\", \"collation_server\")'"
-            )
-            vars_output = stdout.read().decode('utf-8').strip()
             for line in vars_output.split('\n')[1:]:  # Skip header
                 if '\t' in line:
                     var_name, var_value = line.split('\t')
                     vars_dict[var_name] = var_value
 
             # Get grants
-            stdin, stdout, stderr = ssh.exec_command(f"{mysql_cmd} -e 'SHOW GRANTS'")
-            grants = stdout.read().decode('utf-8').strip().upper()
+            grants = grants_output.upper()
             has_privileges = any(priv in grants for priv in [
                 'SUPER', 'SYSTEM_VARIABLES_ADMIN', 'SESSION_VARIABLES_ADMIN', 
                 'ALL PRIVILEGES', 'GRANT ALL', 'GRANT ALL PRIVILEGES', 
@@ -76,11 +80,6 @@ def get_mysql_info(db_config: Dict[str, str], server_type: str = 'import', ssh:
             ])
 
             # Get database size
-            stdin, stdout, stderr = ssh.exec_command(
-                f"{mysql_cmd} -e 'SELECT ROUND(SUM(data_length + index_length) / 1024 / 1024, 1) "
-                f"AS size FROM information_schema.tables WHERE table_schema = \"{database}\"'"
-            )
-            db_size_output = stdout.read().decode('utf-8').strip()
             db_size = db_size_output.split('\n')[-1].strip() if db_size_output else "Unknown"
 
         else:
@@ -19,17 +19,9 @@ import sys
 import atexit
 from typing import Optional, Tuple
 
-# Add the current directory to the Python path when running as a module
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.append(current_dir)
-
-# To:
 from mysql_sync_manager.config import DB_CONFIG, SSH_CONFIG, validate_config, select_configuration
-
-# And similarly for other imports:
 from mysql_sync_manager.utils import print_header, SpinnerProgress, GREEN, RED, YELLOW, BLUE, BOLD, DIM, NC, ICONS
-from mysql_sync_manager.ssh import connect_ssh, execute_remote_command
+from mysql_sync_manager.ssh import acquire_ssh, release_ssh, pool_clear, execute_remote_command
 from mysql_sync_manager.db import restore_database
 from mysql_sync_manager.backup_operations import extract_backup, download_file
 from mysql_sync_manager.menu import select_backup_option
@@ -101,8 +93,8 @@ def setup_configuration() -> bool:
 def establish_ssh_connection() -> Optional[SSHClient]:
     """Establish SSH connection using configuration settings.
 
-    Creates and configures an SSH client connection using the settings from
-    SSH_CONFIG. Handles both password and key-based authentication.
+    Reuses an idle pooled SSH client for SSH_CONFIG or creates a new
+    connection. Handles both password and key-based authentication.
 
     Returns:
         Optional[SSHClient]: Connected SSH client if successful, None if connection fails
@@ -114,7 +106,7 @@ def establish_ssh_connection() -> Optional[SSHClient]:
         ...     return
     """
     try:
-        ssh = connect_ssh(SSH_CONFIG, DB_CONFIG)
+        ssh = acquire_ssh(SSH_CONFIG, DB_CONFIG)
         print(f"{GREEN}{ICONS['check']} SSH connection established{NC}")
         return ssh
     except Exception as e:
@@ -215,6 +207,18 @@ def run_backup_workflow(ssh: SSHClient) -> Tuple[bool, bool]:
         print(f"{RED}Error in backup workflow: {str(e)}{NC}")
         return False, True  # Continue both loops
 
+# main() calls itself to recover from errors; exit handlers are registered once
+_exit_handlers_registered = False
+
+def _register_exit_handlers() -> None:
+    """Register cleanup and pool shutdown with atexit, once per process."""
+    global _exit_handlers_registered
+    if _exit_handlers_registered:
+        return
+    atexit.register(cleanup)
+    atexit.register(pool_clear)
+    _exit_handlers_registered = True
+
 def main():
     """Main entry point for MySQL Sync Manager.
 
@@ -236,12 +240,12 @@ def main():
 
     Note:
         - Exits gracefully on KeyboardInterrupt (Ctrl+C)
-        - Ensures SSH connections are properly closed
+        - Returns SSH connections to the pool; pooled connections are closed on exit
         - Runs cleanup on exit through atexit handler
     """
     try:
         print_header()
-        atexit.register(cleanup)
+        _register_exit_handlers()
         
         while True:  # Main program loop
             if not setup_configuration():
@@ -258,8 +262,8 @@ def main():
                     if not continue_inner:
                         break
             finally:
-                ssh.close()
-                print(f"{DIM}SSH connection closed{NC}")
+                release_ssh(SSH_CONFIG, ssh)
+                print(f"{DIM}SSH connection released{NC}")
 
     except KeyboardInterrupt:
         print(f"\n\n{YELLOW}Operation cancelled by user{NC}")
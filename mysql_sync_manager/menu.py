@@ -3,7 +3,7 @@ import os
 import sys
 from typing import Optional, Dict
 from mysql_sync_manager.utils import RED, YELLOW, BLUE, NC, BOLD, ICONS
-from mysql_sync_manager.ssh import list_remote_backups, check_remote_file
+from mysql_sync_manager.ssh import probe_and_list, check_remote_file
 from mysql_sync_manager.backup_operations import create_new_backup
 from mysql_sync_manager.exceptions import ValidationError, BackupError
 
@@ -88,7 +88,10 @@ def select_existing_backup(ssh, backup_dir: str) -> Optional[str]:
         BackupError: If backup listing fails
     """
     try:
-        backup_files = list_remote_backups(ssh, backup_dir)
+        dir_exists, backup_files = probe_and_list(ssh, backup_dir)
+        if not dir_exists:
+            print(f"{YELLOW}{ICONS['warning']} Backup directory {backup_dir} not found on server{NC}")
+            return None
         if not backup_files:
             print(f"{YELLOW}{ICONS['warning']} No backup files found in {backup_dir}{NC}")
             return None
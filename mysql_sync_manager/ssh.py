@@ -2,12 +2,145 @@
 import os
 import time
 import paramiko
+import select
+import shlex
 import socket
-from typing import List, Dict, Optional
-from mysql_sync_manager.utils import GREEN, RED, BLUE, YELLOW, DIM, NC, CLEAR_LINE, ICONS, BOLD
+import threading
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple, Deque
+from mysql_sync_manager.utils import GREEN, RED, BLUE, YELLOW, DIM, NC, CLEAR_LINE, ICONS, BOLD, format_size
 from mysql_sync_manager.exceptions import SSHConnectionError, ValidationError, BackupError
 from mysql_sync_manager.retry_utils import with_retry, RetryContext
 
+# Resolved SSH hosts: (host, port) -> (getaddrinfo result, expiry on the
+# time.monotonic() clock)
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[List[tuple], float]] = {}
+_DNS_TTL = 900
+_DNS_LOCK = threading.Lock()
+_SSH_PORT = 22
+
+# Idle connected clients: (host, user, key_path) -> clients ready for reuse
+_POOL_SIZE = 8
+_POOL: Dict[Tuple, Deque[paramiko.SSHClient]] = defaultdict(deque)
+_POOL_LOCK = threading.Lock()
+
+# probe_and_list exit status meaning the backup directory does not exist
+_MISSING_DIR_STATUS = 90
+
+# Concurrent channels run_many opens on one transport (sshd MaxSessions is 10)
+_MAX_SESSIONS = 8
+_RECV_SIZE = 65536
+_READ_TIMEOUT = 300
+
+def _resolve_host(host: str, port: int = _SSH_PORT) -> List[tuple]:
+    """Resolve hostname, reusing cached address info until its TTL expires.
+
+    Uses getaddrinfo, so IPv6-only hosts resolve as well.
+
+    Args:
+        host: Hostname to resolve
+        port: SSH port the address info is looked up for
+        
+    Returns:
+        List[tuple]: getaddrinfo() entries for the host, IPv4 and IPv6
+        
+    Raises:
+        socket.gaierror: If the host cannot be resolved
+    """
+    key = (host, port)
+    now = time.monotonic()
+    with _DNS_LOCK:
+        infos, expiry = _DNS_CACHE.get(key, (None, 0.0))
+        if infos is None or expiry < now:
+            infos = socket.getaddrinfo(host, port, socket.AF_UNSPEC, socket.SOCK_STREAM)
+            _DNS_CACHE[key] = (infos, now + _DNS_TTL)
+        return infos
+
+def _dial(infos: List[tuple], timeout: float = 10) -> socket.socket:
+    """Open a TCP connection to the first reachable resolved address.
+
+    Tries each getaddrinfo() entry in order, as SSHClient.connect does, so
+    an unreachable IPv6 address falls back to IPv4. The full sockaddr is
+    used, keeping the scope id of link-local IPv6 addresses.
+
+    Args:
+        infos: getaddrinfo() entries from _resolve_host
+        timeout: Connect timeout in seconds for each address
+        
+    Returns:
+        socket.socket: Connected socket
+        
+    Raises:
+        OSError: The error from the last address if none could be reached
+    """
+    error = None
+    for family, socktype, proto, _, sockaddr in infos:
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            sock.close()
+            error = e
+    raise error
+
+def _parse_backup_rows(output: str) -> List[Dict[str, str]]:
+    """Parse find -printf "size<TAB>mtime<TAB>path" rows into backup info dicts."""
+    backup_files = []
+    for line in output.split('\n'):
+        try:
+            size, mtime, name = line.split('\t', 2)
+            date = datetime.fromtimestamp(float(mtime)).strftime('%Y-%m-%d %H:%M')
+            backup_files.append({'name': name, 'size': format_size(int(size)), 'date': date})
+        except ValueError:
+            continue  # Skip malformed lines
+    
+    return sorted(backup_files, key=lambda x: x['name'], reverse=True)  # Sort by name descending
+
+def probe_and_list(ssh: paramiko.SSHClient, backup_dir: str) -> Tuple[bool, List[Dict[str, str]]]:
+    """Check that a remote backup directory exists and list its backups.
+    
+    Both answers come from a single remote command, so only one SSH
+    channel is opened.
+
+    Args:
+        ssh: SSH client connection
+        backup_dir: Directory to search
+        
+    Returns:
+        Tuple[bool, List[Dict[str, str]]]: Whether the directory exists, and
+            the backups in it (see list_remote_backups)
+            
+    Raises:
+        BackupError: If the listing command fails for any other reason
+        paramiko.SSHException: If the command cannot be run
+    """
+    # Look for both .sql.gz and .tar.gz files using the configured backup_dir.
+    # find -printf emits "size<TAB>mtime<TAB>path" rows, so nothing depends
+    # on ls column layout or locale-specific dates. A missing directory gets
+    # its own exit status so it is not confused with a failing find.
+    quoted_dir = shlex.quote(backup_dir)
+    stdin, stdout, stderr = ssh.exec_command(
+        f"test -d {quoted_dir} || exit {_MISSING_DIR_STATUS}; "
+        f"find {quoted_dir} -maxdepth 1 -type f "
+        f"\\( -name '*.sql.gz' -o -name '*.tar.gz' \\) "
+        f"-printf '%s\\t%T@\\t%p\\n'"
+    )
+    
+    # One oddly encoded filename must not make the whole directory unlistable
+    files = stdout.read().decode('utf-8', errors='replace').strip()
+    exit_code = stdout.channel.recv_exit_status()
+    
+    if exit_code == _MISSING_DIR_STATUS:
+        return False, []
+    if exit_code != 0:
+        error = stderr.read().decode('utf-8', errors='replace').strip()
+        raise BackupError("listing", error or f"Listing {backup_dir} failed with exit status {exit_code}")
+    
+    return True, _parse_backup_rows(files)
+
 def list_remote_backups(ssh: paramiko.SSHClient, backup_dir: str) -> List[Dict[str, str]]:
     """List backup files in remote directory.
     
@@ -22,40 +155,34 @@ def list_remote_backups(ssh: paramiko.SSHClient, backup_dir: str) -> List[Dict[s
             - name: Backup filename
             - size: File size
             - date: Modification date
-            
-    Raises:
-        BackupError: If listing fails
+            Empty if the listing fails for any reason.
     """
     try:
-        # Look for both .sql.gz and .tar.gz files using the configured backup_dir
-        backup_patterns = f"{backup_dir}/*.sql.gz {backup_dir}/*.tar.gz"
-        
-        stdin, stdout, stderr = ssh.exec_command(f"ls -lh {backup_patterns} 2>/dev/null || true")
-        
-        files = stdout.read().decode('utf-8').strip()
-        
-        if not files:
-            return []
-        
-        backup_files = []
-        for line in files.split('\n'):
-            if line.strip():
-                try:
-                    parts = line.split()
-                    if len(parts) >= 9:
-                        size = parts[4]
-                        name = parts[8]
-                        date = ' '.join(parts[5:8])
-                        backup_files.append({'name': name, 'size': size, 'date': date})
-                except Exception:
-                    continue  # Skip malformed lines
-        
-        return sorted(backup_files, key=lambda x: x['name'], reverse=True)  # Sort by name descending
-    
-    except Exception:
-        # Catch any unexpected exceptions
+        return probe_and_list(ssh, backup_dir)[1]
+    except Exception as e:
+        print(f"{RED}Error listing remote backups: {str(e)}{NC}")
         return []
 
+def _connect_via(ssh: paramiko.SSHClient, host: str, infos: List[tuple], **auth) -> None:
+    """Dial the resolved addresses and run the SSH handshake over that socket.
+
+    The socket is opened only now, after key loading and any passphrase
+    prompt, and is closed if the handshake fails for any reason. connect()
+    still gets the hostname, so host key checks use it rather than the IP.
+
+    Args:
+        ssh: Client to connect
+        host: Hostname used for host key checks
+        infos: getaddrinfo() entries from _resolve_host
+        **auth: Credentials passed on to SSHClient.connect
+    """
+    sock = _dial(infos)
+    try:
+        ssh.connect(host, sock=sock, timeout=10, **auth)
+    except BaseException:
+        sock.close()
+        raise
+
 def connect_ssh(config: Dict[str, str], db_config: Dict[str, str]) -> Optional[paramiko.SSHClient]:
     """Establish SSH connection with encrypted key support.
     
@@ -71,24 +198,28 @@ def connect_ssh(config: Dict[str, str], db_config: Dict[str, str]) -> Optional[p
     Raises:
         SSHConnectionError: If connection fails
     """
+    # Validate SSH configuration before any DNS or socket work
+    if not config['HOST']:
+        raise ValidationError("SSH_HOST", "SSH host is required")
+    if not config['USER']:
+        raise ValidationError("SSH_USER", "SSH user is required")
+    if not (config['PASSWORD'] or config['KEY_PATH']):
+        raise ValidationError("SSH_AUTH", "Either password or key path is required")
+
     ssh = paramiko.SSHClient()
-    ssh.load_system_host_keys()
+    # Parsing known_hosts is skipped only when asked for. Unknown hosts are
+    # auto-added either way, but without it a changed host key is no longer
+    # rejected, so this is meant for trusted, automated setups.
+    if not config.get('SKIP_HOST_KEYS'):
+        ssh.load_system_host_keys()
     ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
     try:
         print(f"\n{ICONS['server']}  Connecting to remote server...")
         
-        # Validate SSH configuration
-        if not config['HOST']:
-            raise ValidationError("SSH_HOST", "SSH host is required")
-        if not config['USER']:
-            raise ValidationError("SSH_USER", "SSH user is required")
-        if not (config['PASSWORD'] or config['KEY_PATH']):
-            raise ValidationError("SSH_AUTH", "Either password or key path is required")
-
         # Attempt to resolve hostname
         try:
-            socket.gethostbyname(config['HOST'])
+            infos = _resolve_host(config['HOST'])
         except socket.gaierror:
             print(f"{RED}✗ Failed to resolve host{NC}")
             raise SSHConnectionError(config['HOST'], "Failed to resolve host")
@@ -123,12 +254,7 @@ def connect_ssh(config: Dict[str, str], db_config: Dict[str, str]) -> Optional[p
             
             print(f"{GREEN}Successfully loaded SSH key{NC}")
             try:
-                ssh.connect(
-                    config['HOST'],
-                    username=config['USER'],
-                    pkey=private_key,
-                    timeout=10
-                )
+                _connect_via(ssh, config['HOST'], infos, username=config['USER'], pkey=private_key)
             except (socket.error, paramiko.SSHException) as e:
                 print(f"{RED}✗ Failed to establish connection: {str(e)}{NC}")
                 raise SSHConnectionError(config['HOST'], f"Failed to establish connection: {str(e)}")
@@ -136,12 +262,8 @@ def connect_ssh(config: Dict[str, str], db_config: Dict[str, str]) -> Optional[p
         # Connect with password
         else:
             try:
-                ssh.connect(
-                    config['HOST'],
-                    username=config['USER'],
-                    password=config['PASSWORD'],
-                    timeout=10
-                )
+                _connect_via(ssh, config['HOST'], infos,
+                             username=config['USER'], password=config['PASSWORD'])
             except paramiko.AuthenticationException as e:
                 print(f"{RED}✗ SSH connection failed: {str(e)}{NC}")
                 raise SSHConnectionError(config['HOST'], f"Authentication failed: {str(e)}")
@@ -158,6 +280,69 @@ def connect_ssh(config: Dict[str, str], db_config: Dict[str, str]) -> Optional[p
         print(f"{RED}✗ SSH connection failed: {str(e)}{NC}")
         raise SSHConnectionError(config['HOST'], str(e))
 
+def _pool_key(config: Dict[str, str]) -> Tuple:
+    """Build the pool key identifying equivalent SSH connections."""
+    return (config['HOST'], config['USER'], config['KEY_PATH'])
+
+def _is_alive(ssh: paramiko.SSHClient) -> bool:
+    """Check that a pooled client's transport is still usable."""
+    transport = ssh.get_transport()
+    if transport is None or not transport.is_active():
+        return False
+    try:
+        transport.send_ignore()
+        return True
+    except (paramiko.SSHException, EOFError, OSError):
+        return False
+
+def acquire_ssh(config: Dict[str, str], db_config: Dict[str, str]) -> Optional[paramiko.SSHClient]:
+    """Get a connected SSH client, reusing an idle pooled one when possible.
+
+    Args:
+        config: SSH configuration dictionary
+        db_config: Database configuration dictionary
+        
+    Returns:
+        Optional[SSHClient]: Connected client
+        
+    Raises:
+        SSHConnectionError: If a new connection is needed and fails
+    """
+    key = _pool_key(config)
+    while True:
+        with _POOL_LOCK:
+            idle = _POOL.get(key)
+            ssh = idle.pop() if idle else None
+        if ssh is None:
+            return connect_ssh(config, db_config)
+        if _is_alive(ssh):
+            return ssh
+        ssh.close()
+
+def release_ssh(config: Dict[str, str], ssh: paramiko.SSHClient) -> None:
+    """Return a client to the pool, closing it if dead or the pool is full.
+
+    Args:
+        config: SSH configuration the client was acquired with
+        ssh: SSH client to release
+    """
+    transport = ssh.get_transport()
+    if transport is not None and transport.is_active():
+        with _POOL_LOCK:
+            idle = _POOL[_pool_key(config)]
+            if len(idle) < _POOL_SIZE:
+                idle.append(ssh)
+                return
+    ssh.close()
+
+def pool_clear() -> None:
+    """Close and forget every idle pooled SSH client."""
+    with _POOL_LOCK:
+        clients = [ssh for idle in _POOL.values() for ssh in idle]
+        _POOL.clear()
+    for ssh in clients:
+        ssh.close()
+
 def check_remote_file(ssh: paramiko.SSHClient, remote_path: str) -> bool:
     """Check if file exists on remote server.
 
@@ -176,6 +361,63 @@ def check_remote_file(ssh: paramiko.SSHClient, remote_path: str) -> bool:
         print(f"{RED}Error checking remote file: {str(e)}{NC}")
         return False
 
+def run_many(ssh: paramiko.SSHClient, commands: List[str],
+             max_sessions: int = _MAX_SESSIONS, timeout: int = _READ_TIMEOUT) -> List[str]:
+    """Run several commands concurrently over one SSH transport.
+    
+    Opens up to max_sessions channels at once and starts every command in
+    the batch before reading any output, so the batch costs one round trip
+    instead of one per command. Output is read from whichever channel has
+    data first, so a batch takes as long as its slowest command rather
+    than the sum of all of them.
+
+    Args:
+        ssh: SSH client connection
+        commands: Commands to execute
+        max_sessions: Maximum channels open at the same time
+        timeout: Seconds to wait for any channel in a batch to become readable
+        
+    Returns:
+        List[str]: Stdout of each command, in the order given
+        
+    Raises:
+        paramiko.SSHException: If the client is not connected, a channel
+            cannot be opened or no output arrives within timeout
+    """
+    transport = ssh.get_transport()
+    if transport is None or not transport.is_active():
+        raise paramiko.SSHException("SSH transport is not connected")
+    outputs = []
+    for start in range(0, len(commands), max_sessions):
+        channels = []
+        try:
+            for command in commands[start:start + max_sessions]:
+                channel = transport.open_session()
+                channels.append(channel)
+                channel.exec_command(command)
+            chunks = {channel: [] for channel in channels}
+            pending = list(channels)
+            while pending:
+                ready, _, _ = select.select(pending, [], [], timeout)
+                if not ready:
+                    raise paramiko.SSHException(f"No output from remote commands after {timeout} seconds")
+                for channel in ready:
+                    # Readiness also fires for stderr, which is discarded;
+                    # only call recv() when it will not block
+                    if channel.recv_stderr_ready():
+                        channel.recv_stderr(_RECV_SIZE)
+                    if channel.recv_ready():
+                        chunks[channel].append(channel.recv(_RECV_SIZE))
+                    elif channel.eof_received or channel.closed:
+                        # A dropped transport closes the channel without an
+                        # EOF and leaves it readable forever
+                        pending.remove(channel)
+            outputs.extend(b''.join(chunks[channel]).decode('utf-8').strip() for channel in channels)
+        finally:
+            for channel in channels:
+                channel.close()
+    return outputs
+
 @with_retry(retries=2, delay=1.0)
 def execute_remote_command(ssh: paramiko.SSHClient, command: str, timeout: int = 300) -> bool:
     """Execute command on remote server.
@@ -203,11 +445,12 @@ def execute_remote_command(ssh: paramiko.SSHClient, command: str, timeout: int =
                 time.sleep(0.1)
             
             exit_code = stdout.channel.recv_exit_status()
-            error_output = stderr.read().decode('utf-8').strip()
             
             if exit_code == 0:
                 return True
             else:
+                # stderr is only drained when there is a failure to report
+                error_output = stderr.read().decode('utf-8').strip()
                 if error_output:
                     print(f"\n{RED}Error output:{NC}\n{error_output}\n")
                 return False
@@ -1,19 +1,51 @@
 #!/usr/bin/env python3
+import os
+import sys
+import signal
+import itertools
 import threading
 import time
 import shutil
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import lru_cache
+from typing import Final
+
+def _isatty(stream) -> bool:
+    try:
+        return stream is not None and stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+def _color_enabled(stream, environ) -> bool:
+    """Decide whether ANSI escape sequences should be written to a stream.
+
+    Escape sequences are only emitted to an interactive terminal; piped or
+    logged output (and NO_COLOR, see https://no-color.org) gets plain text.
+
+    Args:
+        stream: Output stream the colors would be written to
+        environ: Environment mapping to read NO_COLOR from
+
+    Returns:
+        bool: True if colors should be used
+    """
+    return _isatty(stream) and not environ.get('NO_COLOR')
+
+_USE_COLOR = _color_enabled(sys.stdout, os.environ)
+
+def _ansi(code: str) -> str:
+    return code if _USE_COLOR else ''
 
 # ANSI Colors and Styles
-BLUE = '\033[0;34m'
-GREEN = '\033[0;32m'
-RED = '\033[0;31m'
-YELLOW = '\033[1;33m'
-CYAN = '\033[0;36m'
-BOLD = '\033[1m'
-DIM = '\033[2m'
-NC = '\033[0m'  # No Color
-CLEAR_LINE = '\033[K'
+BLUE: Final = _ansi('\033[0;34m')
+GREEN: Final = _ansi('\033[0;32m')
+RED: Final = _ansi('\033[0;31m')
+YELLOW: Final = _ansi('\033[1;33m')
+CYAN: Final = _ansi('\033[0;36m')
+BOLD: Final = _ansi('\033[1m')
+DIM: Final = _ansi('\033[2m')
+NC: Final = _ansi('\033[0m')  # No Color
+CLEAR_LINE: Final = _ansi('\033[K')
 
 # UI Icons
 ICONS = {
@@ -33,6 +65,11 @@ ICONS = {
     'spinner': ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']  # Spinner animation
 }
 
+# Icons used on every status line, bound once instead of looked up per print
+CHECK_ICON: Final = ICONS['check']
+TIMES_ICON: Final = ICONS['times']
+SPINNER_FRAMES: Final = tuple(ICONS['spinner'])
+
 class SpinnerProgress:
     """Progress indicator with spinner animation.
     
@@ -43,46 +80,114 @@ class SpinnerProgress:
     """
     def __init__(self, message):
         self.message = message
-        self.spinner = ICONS['spinner']
-        self._active = True
+        self.spinner = SPINNER_FRAMES
+        # One ready-made line per spinner frame; only the elapsed time varies
+        escaped = message.replace('%', '%%')
+        self._frames = [f"\r{BLUE}{c}{NC} {escaped} (%s){CLEAR_LINE}" for c in self.spinner]
+        self._stop = threading.Event()
         self.start_time = time.time()
         self.thread = None
+        # Frames go straight to the stderr file descriptor, bypassing the
+        # text layer; fall back to sys.stderr when it has no real descriptor
+        try:
+            self._fd = sys.stderr.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._fd = None
+        self._encoding = getattr(sys.stderr, 'encoding', None) or 'utf-8'
+        # Redrawing frames nobody can see only fills logs with \r-separated noise
+        self._animate = _isatty(sys.stderr)
+
+    def _write_frame(self, text):
+        if self._fd is None:
+            sys.stderr.write(text)
+            sys.stderr.flush()
+        else:
+            os.write(self._fd, text.encode(self._encoding, 'replace'))
 
     def _get_time_string(self):
         elapsed = int(time.time() - self.start_time)
         return str(timedelta(seconds=elapsed))
 
     def spin(self):
-        idx = 0
-        while self._active:
-            time_str = self._get_time_string()
-            print(f"\r{BLUE}{self.spinner[idx]}{NC} {self.message} ({time_str})", end='', flush=True)  # Removed ... and fixed spacing
-            idx = (idx + 1) % len(self.spinner)
-            time.sleep(0.1)
+        write = self._write_frame
+        for frame in itertools.cycle(self._frames):
+            write(frame % self._get_time_string())
+            # Wakes as soon as stop() is called instead of finishing a sleep
+            if self._stop.wait(0.1):
+                break
 
     def start(self):
-        self._active = True
+        self._stop.clear()
         self.start_time = time.time()
+        if not self._animate:
+            return
         self.thread = threading.Thread(target=self.spin)
         self.thread.start()
 
     def stop(self, success=True):
-        self._active = False
+        self._stop.set()
         if self.thread:
             self.thread.join()
+            self._write_frame(f"\r{CLEAR_LINE}")
         time_str = self._get_time_string()
         if success:
-            print(f"\r{GREEN}{ICONS['check']}{NC} {self.message} ({time_str})", end='\n\n', flush=True)  # Added double newline
+            print(f"\r{GREEN}{CHECK_ICON}{NC} {self.message} ({time_str})", end='\n\n', flush=True)  # Added double newline
         else:
-            print(f"\r{RED}{ICONS['times']}{NC} {self.message} ({time_str})", end='\n\n', flush=True)  # Added double newline
+            print(f"\r{RED}{TIMES_ICON}{NC} {self.message} ({time_str})", end='\n\n', flush=True)  # Added double newline
+
+def format_size(num_bytes: int) -> str:
+    """Format a byte count the way ``ls -lh`` does (e.g. 512, 1.1K, 12M).
+
+    Like GNU ls, sizes are rounded up: to a tenth below 10 of a unit and to
+    a whole unit above.
+
+    Args:
+        num_bytes: Size in bytes
+
+    Returns:
+        str: Human-readable size
+    """
+    num_bytes = int(num_bytes)
+    if num_bytes < 1024:
+        return str(num_bytes)
+    for power, unit in enumerate(('K', 'M', 'G', 'T'), 1):
+        scale = 1024 ** power
+        tenths = -(-num_bytes * 10 // scale)  # Integer ceiling, no float error
+        if tenths < 100:
+            return f"{tenths // 10}.{tenths % 10}{unit}"
+        whole = -(-num_bytes // scale)
+        if whole < 1024 or unit == 'T':
+            return f"{whole}{unit}"
+
+# Terminal width, read once and refreshed on SIGWINCH where available
+_TERM_COLS = None
+
+def _refresh_term_cols(*_):
+    global _TERM_COLS
+    _TERM_COLS = shutil.get_terminal_size().columns
+
+def _terminal_width() -> int:
+    """Return the cached terminal width, reading it on first use."""
+    if _TERM_COLS is None:
+        _refresh_term_cols()
+        try:
+            signal.signal(signal.SIGWINCH, _refresh_term_cols)
+        except (AttributeError, ValueError):
+            pass  # No SIGWINCH (Windows) or not on the main thread
+    return _TERM_COLS
+
+@lru_cache(maxsize=4)
+def _header_bar(width: int) -> str:
+    return f"{CYAN}{'='*width}{NC}"
 
 def print_header():
     """Print application header.
     
     Prints title and timestamp.
     """
-    terminal_width = shutil.get_terminal_size().columns
-    print(f"{CYAN}{'='*terminal_width}{NC}")
+    terminal_width = _terminal_width()
+    bar = _header_bar(terminal_width)
+    print(bar)
     print(f"{BOLD}Database Local Manager{NC}".center(terminal_width))
-    print(f"{DIM}{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{NC}".center(terminal_width))
-    print(f"{CYAN}{'='*terminal_width}{NC}\n")
\ No newline at end of file
+    print(f"{DIM}{time.strftime('%Y-%m-%d %H:%M:%S')}{NC}".center(terminal_width))
+    print(f"{bar}\n")
@@ -1,35 +1,112 @@
 # tests/conftest.py
 import os
-import glob
 import pytest
+import paramiko
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch
+from paramiko import SSHClient
+from mysql_sync_manager.ssh import pool_clear
+
+# getaddrinfo() answer for every stubbed host lookup
+_ADDR_INFO = [(2, 1, 6, '', ('1.2.3.4', 22))]
+
+# Shared exec_command placeholders for slots tests never inspect
+DUMMY_STDIN = Mock(name="stdin")
+EMPTY_STDERR = Mock(name="stderr")
+EMPTY_STDERR.read.return_value = b""
+
+# mysql_sync_manager.main attributes replaced by the main_mocks fixture
+_MAIN_PATCHES = (
+    'print_header',
+    'setup_configuration',
+    'establish_ssh_connection',
+    'run_backup_workflow',
+    'release_ssh',
+)
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each test in its own temporary working directory.
+
+    Backup files written to the working directory land there, so xdist
+    workers never see (or delete) each other's files.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture(scope="session")
+def _ssh_class_patch():
+    """Keep paramiko.SSHClient patched for the whole session."""
+    patcher = patch.object(paramiko, 'SSHClient')
+    ssh_class = patcher.start()
+    yield ssh_class
+    patcher.stop()
 
 @pytest.fixture(autouse=True)
-def cleanup_after_test():
-    """Cleanup after each test."""
-    yield
-    # Clean up any files that might have been created
-    try:
-        for f in glob.glob('*.sql*'):
-            os.remove(f)
-    except Exception:
-        pass
+def _mock_network(monkeypatch, _ssh_class_patch):
+    """Stub DNS and sockets and hand out a fresh paramiko.SSHClient instance per test."""
+    monkeypatch.setattr('socket.getaddrinfo', lambda *args, **kwargs: _ADDR_INFO)
+    monkeypatch.setattr('mysql_sync_manager.ssh._dial', Mock(name="dial"))
+    monkeypatch.setattr('mysql_sync_manager.ssh._DNS_CACHE', {})
+    _ssh_class_patch.return_value = Mock(spec=SSHClient)
+    _ssh_class_patch.side_effect = None
+    yield _ssh_class_patch
+    _ssh_class_patch.reset_mock()
+    pool_clear()
 
 @pytest.fixture
-def mock_ssh():
+def mock_ssh(_mock_network):
     """Provide a mock SSH client with basic responses."""
-    with patch('paramiko.SSHClient') as mock_ssh:
-        ssh_instance = Mock()
-        mock_ssh.return_value = ssh_instance
-        
-        # Set up default responses
-        stdin, stdout, stderr = Mock(), Mock(), Mock()
-        stdout.channel.recv_exit_status.return_value = 0
-        stdout.read.return_value = b"test"
-        stderr.read.return_value = b""
-        ssh_instance.exec_command.return_value = (stdin, stdout, stderr)
-        
-        yield ssh_instance
+    ssh_instance = _mock_network.return_value
+    
+    # Set up default responses
+    stdin, stdout, stderr = Mock(), Mock(), Mock()
+    stdout.channel.recv_exit_status.return_value = 0
+    stdout.read.return_value = b"test"
+    stderr.read.return_value = b""
+    ssh_instance.exec_command.return_value = (stdin, stdout, stderr)
+    
+    return ssh_instance
+
+@pytest.fixture
+def exec_result():
+    """Build exec_command (stdin, stdout, stderr) triples from raw output."""
+    def _make(stdout=b"", stderr=b"", exit_status=0):
+        out = Mock(name="stdout")
+        out.read.return_value = stdout
+        out.channel.recv_exit_status.return_value = exit_status
+        err = EMPTY_STDERR
+        if stderr:
+            err = Mock(name="stderr")
+            err.read.return_value = stderr
+        return (DUMMY_STDIN, out, err)
+    return _make
+
+@pytest.fixture
+def ssh_mock():
+    """Provide a bare SSH client mock for code that receives a client."""
+    return Mock(spec=SSHClient)
+
+@pytest.fixture(scope="session")
+def main_module():
+    """Import mysql_sync_manager.main once per session."""
+    from mysql_sync_manager import main
+    return main
+
+@pytest.fixture
+def main_mocks(main_module, monkeypatch):
+    """Replace main()'s collaborators with mocks."""
+    mocks = {name: Mock() for name in _MAIN_PATCHES}
+    for name, mock in mocks.items():
+        monkeypatch.setattr(main_module, name, mock)
+    monkeypatch.setattr(main_module.atexit, 'register', Mock())
+    monkeypatch.setattr(main_module, '_exit_handlers_registered', False)
+    return SimpleNamespace(
+        setup=mocks['setup_configuration'],
+        ssh=mocks['establish_ssh_connection'],
+        workflow=mocks['run_backup_workflow'],
+        release=mocks['release_ssh']
+    )
 
 @pytest.fixture
 def mock_config():
@@ -49,14 +126,53 @@ def mock_config():
         'HAS_PRIVILEGES': True
     }
 
+@pytest.fixture(scope="session")
+def mock_menu_config():
+    """Provide read-only menu test configuration, built once per session."""
+    return MappingProxyType({
+        'MYSQL_EXPORT_BACKUP_DIR': '/backup/dir',
+        'MYSQL_EXPORT_HOST': 'test-host',
+        'MYSQL_EXPORT_USER': 'test-user',
+        'MYSQL_EXPORT_PASSWORD': 'test-pass',
+        'MYSQL_EXPORT_DATABASE': 'test_db'
+    })
+
+@pytest.fixture(scope="session")
+def ssh_password_config():
+    """Provide read-only password-auth SSH configuration."""
+    return MappingProxyType({
+        'HOST': 'test-host',
+        'USER': 'test-user',
+        'PASSWORD': 'test-pass',
+        'KEY_PATH': None
+    })
+
+@pytest.fixture(scope="session")
+def ssh_key_config(tmp_path_factory):
+    """Provide read-only key-auth SSH configuration.
+
+    The key file is written once per session (per xdist worker).
+    """
+    key_path = tmp_path_factory.mktemp("keys") / "test_key"
+    key_path.write_text("test key content")
+    os.chmod(key_path, 0o600)
+    return MappingProxyType({
+        'HOST': 'test-host',
+        'USER': 'test-user',
+        'PASSWORD': None,
+        'KEY_PATH': str(key_path)
+    })
+
 @pytest.fixture(autouse=True)
 def mock_print(monkeypatch):
     """Suppress print output during tests."""
     monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
 
 @pytest.fixture(autouse=True)
-def mock_filesystem():
+def mock_filesystem(isolated_cwd):
     """Mock filesystem operations for all tests."""
+    # Depends on isolated_cwd so the per-test temp dir exists before os.stat
+    # is patched; tmp_path could not tell that it already exists otherwise.
     with patch('os.stat') as mock_stat, \
          patch('os.path.exists', return_value=True), \
          patch('linecache.checkcache') as mock_checkcache:
@@ -2,10 +2,38 @@
 import pytest
 from unittest.mock import patch, mock_open
 from mysql_sync_manager.exceptions import ConfigurationError, ValidationError
+from mysql_sync_manager import config as config_module
+from mysql_sync_manager.config import (
+    validate_config, merge_config, select_configuration, DB_CONFIG, SSH_CONFIG
+)
+
+_FULL_YAML = """
+configurations:
+  test:
+    name: "Test Environment"
+    config:
+      MYSQL_EXPORT_HOST: "test-host"
+      MYSQL_EXPORT_DATABASE: "test_db"
+      MYSQL_EXPORT_USER: "test-user"
+      MYSQL_EXPORT_PASSWORD: "test-pass"
+      MYSQL_EXPORT_BACKUP_DIR: "/backup"
+      MYSQL_IMPORT_USER: "local-user"
+      MYSQL_IMPORT_PASSWORD: "local-pass"
+      MYSQL_IMPORT_DATABASE: "local_db"
+      SSH_HOST: "test-ssh"
+      SSH_USER: "test-user"
+"""
+
+_MINIMAL_YAML = """
+configurations:
+  test:
+    name: "Test Environment"
+    config:
+      MYSQL_EXPORT_HOST: "test-host"
+      MYSQL_EXPORT_DATABASE: "test_db"
+"""
 
 def test_validate_config():
-    from mysql_sync_manager.config import validate_config, DB_CONFIG, SSH_CONFIG
-    
     # Initialize with all required keys (even if empty)
     DB_CONFIG.update({
         'MYSQL_EXPORT_USER': '',
@@ -24,8 +52,6 @@ def test_validate_config():
 
 def test_validate_config_success(mock_config):
     """Test successful configuration validation."""
-    from mysql_sync_manager.config import validate_config, DB_CONFIG, SSH_CONFIG
-    
     # Initialize DB_CONFIG with all required keys
     DB_CONFIG.clear()
     DB_CONFIG.update({
@@ -52,8 +78,6 @@ def test_validate_config_success(mock_config):
 
 def test_validate_config_missing_values():
     """Test configuration validation with missing values."""
-    from mysql_sync_manager.config import validate_config, DB_CONFIG, SSH_CONFIG
-    
     # Initialize with empty values
     DB_CONFIG.clear()
     DB_CONFIG.update({
@@ -82,8 +106,6 @@ def test_validate_config_missing_values():
 
 def test_merge_config_validation():
     """Test configuration merging with validation."""
-    from mysql_sync_manager.config import merge_config
-    
     base = {'key1': 'value1', 'key2': None}
     updates = {'key2': 'value2', 'key3': 'value3'}
     
@@ -94,8 +116,6 @@ def test_merge_config_validation():
 
 def test_merge_config_empty_value():
     """Test merging config with empty value."""
-    from mysql_sync_manager.config import merge_config
-    
     base = {'key1': 'value1'}
     updates = {'key1': ''}
     
@@ -105,47 +125,37 @@ def test_merge_config_empty_value():
 
 def test_select_configuration_success():
     """Test successful configuration selection."""
-    from mysql_sync_manager.config import select_configuration
-    
-    yaml_content = """
-    configurations:
-      test:
-        name: "Test Environment"
-        config:
-          MYSQL_EXPORT_HOST: "test-host"
-          MYSQL_EXPORT_DATABASE: "test_db"
-          MYSQL_EXPORT_USER: "test-user"
-          MYSQL_EXPORT_PASSWORD: "test-pass"
-          MYSQL_EXPORT_BACKUP_DIR: "/backup"
-          MYSQL_IMPORT_USER: "local-user"
-          MYSQL_IMPORT_PASSWORD: "local-pass"
-          MYSQL_IMPORT_DATABASE: "local_db"
-          SSH_HOST: "test-ssh"
-          SSH_USER: "test-user"
-    """
-    
-    with patch('builtins.open', mock_open(read_data=yaml_content)), \
+    with patch('builtins.open', mock_open(read_data=_FULL_YAML)), \
          patch('os.path.exists', return_value=True), \
          patch('builtins.input', return_value='1'):
         
         result = select_configuration()
         assert result is True
 
+@pytest.mark.parametrize("raw_value,expected", [
+    (None, False),
+    ('"false"', False),
+    ('"0"', False),
+    ("false", False),
+    ("true", True),
+    ('"yes"', True),
+])
+def test_select_configuration_skip_host_keys(raw_value, expected):
+    """Test that SSH_SKIP_HOST_KEYS is only enabled by an explicit yes"""
+    yaml_text = _FULL_YAML
+    if raw_value is not None:
+        yaml_text += f"      SSH_SKIP_HOST_KEYS: {raw_value}\n"
+    
+    with patch('builtins.open', mock_open(read_data=yaml_text)), \
+         patch('os.path.exists', return_value=True), \
+         patch('builtins.input', return_value='1'):
+        
+        assert select_configuration() is True
+    assert config_module.SSH_CONFIG['SKIP_HOST_KEYS'] is expected
+
 def test_select_configuration_quit():
     """Test configuration selection with quit option."""
-    from mysql_sync_manager.config import select_configuration
-    import sys
-    
-    yaml_content = """
-    configurations:
-      test:
-        name: "Test Environment"
-        config:
-          MYSQL_EXPORT_HOST: "test-host"
-          MYSQL_EXPORT_DATABASE: "test_db"
-    """
-    
-    with patch('builtins.open', mock_open(read_data=yaml_content)), \
+    with patch('builtins.open', mock_open(read_data=_MINIMAL_YAML)), \
          patch('os.path.exists', return_value=True), \
          patch('builtins.input', return_value='q'), \
          pytest.raises(SystemExit):
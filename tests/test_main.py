@@ -1,84 +1,143 @@
 import pytest
-from unittest.mock import Mock, patch
-from mysql_sync_manager.exceptions import SSHConnectionError
+from unittest.mock import Mock, create_autospec
 
-def test_main_basic_workflow():
+pytestmark = pytest.mark.mock_only
+
+# Reusable side-effect sequences; tests only check call counts and exit
+# codes, so sharing the exception instances is safe.
+_KBI = KeyboardInterrupt()
+_OK_THEN_EXIT = (True, _KBI)
+_FAIL_THEN_EXIT = (False, _KBI)
+
+def test_main_basic_workflow(main_module, main_mocks, ssh_mock):
     """Test main function with basic successful workflow"""
-    ssh_mock = Mock()
-    with patch('mysql_sync_manager.main.print_header'), \
-         patch('mysql_sync_manager.main.setup_configuration') as mock_setup, \
-         patch('mysql_sync_manager.main.establish_ssh_connection') as mock_ssh, \
-         patch('mysql_sync_manager.main.run_backup_workflow') as mock_workflow, \
-         patch('mysql_sync_manager.main.atexit.register'):
-        
-        # Setup mocks
-        mock_setup.side_effect = [True, KeyboardInterrupt()]  # Success then exit
-        mock_ssh.return_value = ssh_mock
-        mock_workflow.return_value = (False, False)  # Complete workflow
-        
-        # Run test
-        with pytest.raises(SystemExit) as exc_info:
-            from mysql_sync_manager.main import main
-            main()
-        
-        # Verify behavior
-        assert exc_info.value.code == 0
-        mock_setup.assert_called()
-        mock_ssh.assert_called_once()
-        mock_workflow.assert_called_once_with(ssh_mock)
-        ssh_mock.close.assert_called_once()
+    main_mocks.setup.side_effect = _OK_THEN_EXIT  # Success then exit
+    main_mocks.ssh.return_value = ssh_mock
+    main_mocks.workflow.return_value = (False, False)  # Complete workflow
+    
+    # Run test
+    with pytest.raises(SystemExit) as exc_info:
+        main_module.main()
+    
+    # Verify behavior
+    assert exc_info.value.code == 0
+    main_mocks.setup.assert_called()
+    main_mocks.ssh.assert_called_once()
+    main_mocks.workflow.assert_called_once_with(ssh_mock)
+    main_mocks.release.assert_called_once_with(main_module.SSH_CONFIG, ssh_mock)
 
-def test_main_error_handling():
+@pytest.mark.parametrize("side_effects,expected_code,expected_calls", [
+    pytest.param((Exception("Test error"), _KBI), 0, 2, id="exception-then-interrupt"),
+    pytest.param((ValueError("Value error"), _KBI), 0, 2, id="value-error-then-interrupt"),
+    pytest.param(_FAIL_THEN_EXIT, 0, 2, id="setup-failed-then-interrupt"),
+    pytest.param((SystemExit(1),), 1, 1, id="system-exit"),
+])
+def test_main_error_handling(main_module, main_mocks, side_effects, expected_code, expected_calls):
     """Test main function error handling"""
-    with patch('mysql_sync_manager.main.print_header'), \
-         patch('mysql_sync_manager.main.setup_configuration') as mock_setup, \
-         patch('mysql_sync_manager.main.atexit.register'):
-        
-        # Test various error conditions
-        mock_setup.side_effect = [
-            Exception("Test error"),    # First attempt fails
-            ValueError("Value error"),  # Second attempt fails differently
-            KeyboardInterrupt()         # Exit
-        ]
-        
-        with pytest.raises(SystemExit) as exc_info:
-            from mysql_sync_manager.main import main
-            main()
-        
-        assert exc_info.value.code == 0
-        assert mock_setup.call_count == 3
+    main_mocks.setup.side_effect = side_effects
+    
+    with pytest.raises(SystemExit) as exc_info:
+        main_module.main()
+    
+    assert exc_info.value.code == expected_code
+    assert main_mocks.setup.call_count == expected_calls
+    main_mocks.ssh.assert_not_called()
+
+def test_main_registers_exit_handlers_once(main_module, main_mocks):
+    """Test that retrying main() after an error does not re-register atexit handlers"""
+    main_mocks.setup.side_effect = (Exception("Test error"), Exception("Again"), _KBI)
+    
+    with pytest.raises(SystemExit):
+        main_module.main()
+    
+    registered = [c.args[0] for c in main_module.atexit.register.call_args_list]
+    assert registered == [main_module.cleanup, main_module.pool_clear]
 
-def test_main_ssh_handling():
+def test_main_ssh_handling(main_module, main_mocks, ssh_mock):
     """Test SSH connection handling in main"""
-    ssh_mock = Mock()
-    with patch('mysql_sync_manager.main.print_header'), \
-         patch('mysql_sync_manager.main.setup_configuration') as mock_setup, \
-         patch('mysql_sync_manager.main.establish_ssh_connection') as mock_ssh, \
-         patch('mysql_sync_manager.main.atexit.register'):
-        
-        # Test SSH failure then success
-        mock_setup.side_effect = [True, KeyboardInterrupt()]
-        mock_ssh.side_effect = [None, ssh_mock]  # First fails, then succeeds
-        
-        with pytest.raises(SystemExit):
-            from mysql_sync_manager.main import main
-            main()
-        
-        mock_ssh.assert_called()
+    # Test SSH failure then success
+    main_mocks.setup.side_effect = _OK_THEN_EXIT
+    main_mocks.ssh.side_effect = (None, ssh_mock)  # First fails, then succeeds
+    
+    with pytest.raises(SystemExit):
+        main_module.main()
+    
+    main_mocks.ssh.assert_called_once()
+    main_mocks.workflow.assert_not_called()
 
-def test_backup_workflow():
+@pytest.fixture
+def _patch_workflow(main_module, monkeypatch):
+    """Replace the collaborators run_backup_workflow() delegates to."""
+    mock_select = create_autospec(main_module.select_backup_option)
+    mock_process = create_autospec(main_module.process_backup)
+    monkeypatch.setattr(main_module, 'select_backup_option', mock_select)
+    monkeypatch.setattr(main_module, 'process_backup', mock_process)
+    return mock_select, mock_process
+
+@pytest.mark.parametrize("select_ret,process_ret,expected", [
+    pytest.param('back', None, (True, False), id="back"),
+    pytest.param('remote.sql.gz', True, (False, False), id="success"),
+    pytest.param('remote.sql.gz', False, (False, True), id="failure"),
+    pytest.param(None, None, (False, True), id="no-selection"),
+])
+def test_backup_workflow(main_module, ssh_mock, _patch_workflow, select_ret, process_ret, expected):
     """Test backup workflow process"""
-    ssh_mock = Mock()
-    with patch('mysql_sync_manager.main.select_backup_option') as mock_select, \
-         patch('mysql_sync_manager.main.process_backup') as mock_process:
-        
-        # Test successful backup
-        mock_select.return_value = 'test.sql.gz'
-        mock_process.return_value = True
-        
-        from mysql_sync_manager.main import run_backup_workflow
-        continue_outer, continue_inner = run_backup_workflow(ssh_mock)
-        
-        assert not continue_outer
-        assert not continue_inner
-        mock_process.assert_called_once_with(ssh_mock, 'test.sql.gz')
\ No newline at end of file
+    mock_select, mock_process = _patch_workflow
+    mock_select.return_value = select_ret
+    mock_process.return_value = process_ret
+    
+    assert main_module.run_backup_workflow(ssh_mock) == expected
+    
+    if process_ret is None:
+        mock_process.assert_not_called()
+    else:
+        mock_process.assert_called_once_with(ssh_mock, select_ret)
+
+@pytest.mark.parametrize("download,extract,restore,delete_input,execute,expected", [
+    ('local.sql.gz', 'local.sql', True, 'n', None, True),
+    (None, None, None, 'n', None, False),
+    ('local.sql.gz', 'local.sql', True, 'y', True, True),
+    ('local.sql.gz', Exception("x"), None, 'n', None, False),
+    ('local.sql.gz', 'local.sql', True, 'y', False, True),
+    ('local.sql.gz', 'local.sql', False, 'n', None, False),
+], ids=["ok", "dl-fail", "delete-ok", "extract-err", "delete-fail", "restore-fail"])
+def test_process_backup(main_module, ssh_mock, monkeypatch, download, extract, restore, delete_input, execute, expected):
+    """Test downloading, extracting and restoring a remote backup"""
+    mocks = {}
+    for name, value in (('download_file', download), ('extract_backup', extract),
+                        ('restore_database', restore), ('execute_remote_command', execute)):
+        mocks[name] = create_autospec(getattr(main_module, name))
+        if isinstance(value, Exception):
+            mocks[name].side_effect = value
+        else:
+            mocks[name].return_value = value
+        monkeypatch.setattr(main_module, name, mocks[name])
+    monkeypatch.setattr(main_module, 'SpinnerProgress', create_autospec(main_module.SpinnerProgress))
+    monkeypatch.setattr('builtins.input', lambda _='': delete_input)
+    
+    assert main_module.process_backup(ssh_mock, '/backup/remote.sql.gz') is expected
+    
+    if delete_input == 'y':
+        mocks['execute_remote_command'].assert_called_once_with(ssh_mock, 'rm /backup/remote.sql.gz')
+    else:
+        mocks['execute_remote_command'].assert_not_called()
+    if download is None:
+        mocks['extract_backup'].assert_not_called()
+
+@pytest.mark.parametrize("listdir_ret,listdir_exc,remove_exc,expected_removes", [
+    (['test.sql.gz', 'test.sql', 'backup.tar.gz', 'other.txt'], None, None, 3),
+    (['test.txt', 'other.log'], None, None, 0),
+    (['test.sql.gz'], None, PermissionError("denied"), 1),
+    (None, OSError("unreadable"), None, 0),
+], ids=["removes-backups", "no-backups", "remove-error", "listdir-error"])
+def test_cleanup(main_module, monkeypatch, listdir_ret, listdir_exc, remove_exc, expected_removes):
+    """Test removal of temporary backup files"""
+    mock_listdir = Mock(return_value=listdir_ret, side_effect=listdir_exc)
+    mock_remove = Mock(side_effect=remove_exc)
+    monkeypatch.setattr('os.listdir', mock_listdir)
+    monkeypatch.setattr('os.remove', mock_remove)
+    
+    main_module.cleanup()
+    
+    mock_listdir.assert_called_once_with('.')
+    assert mock_remove.call_count == expected_removes
@@ -1,20 +1,16 @@
 import pytest
-import sys
-from unittest.mock import Mock, patch, call
+from unittest.mock import Mock
 from mysql_sync_manager.exceptions import ValidationError, BackupError
 from mysql_sync_manager.menu import select_backup_option, select_existing_backup, select_custom_backup
 
-@pytest.fixture
-def mock_menu_config():
-    """Fixture providing standard menu test configuration."""
-    return {
-        'MYSQL_EXPORT_BACKUP_DIR': '/backup/dir',
-        'MYSQL_EXPORT_HOST': 'test-host',
-        'MYSQL_EXPORT_USER': 'test-user',
-        'MYSQL_EXPORT_PASSWORD': 'test-pass',
-        'MYSQL_EXPORT_DATABASE': 'test_db'
-    }
+# Scripted input() answers shared across tests
+_QUIT_INPUT = ('q',)
+_BACK_INPUT = ('b',)
 
+def _feed_input(monkeypatch, answers):
+    """Answer successive input() prompts with the given strings."""
+    responses = iter(answers)
+    monkeypatch.setattr('builtins.input', lambda _='': next(responses))
 
 def test_select_backup_option(mock_ssh, mock_config, monkeypatch):
     """Test selecting backup options."""
@@ -22,13 +18,12 @@ def test_select_backup_option(mock_ssh, mock_config, monkeypatch):
         {'name': '/backup/test1.sql.gz', 'size': '1.2M', 'date': '2024-01-01'},
         {'name': '/backup/test2.sql.gz', 'size': '1.5M', 'date': '2024-01-02'}
     ]
+    monkeypatch.setattr('mysql_sync_manager.menu.probe_and_list', lambda *a, **k: (True, backups))
+    monkeypatch.setattr('mysql_sync_manager.menu.check_remote_file', lambda *a, **k: True)
+    _feed_input(monkeypatch, ('2', '1'))
     
-    with patch('mysql_sync_manager.menu.list_remote_backups', return_value=backups), \
-         patch('mysql_sync_manager.menu.check_remote_file', return_value=True), \
-         patch('builtins.input', side_effect=['2', '1']):
-        
-        result = select_backup_option(mock_ssh, mock_config)
-        assert result == '/backup/test1.sql.gz'
+    result = select_backup_option(mock_ssh, mock_config)
+    assert result == '/backup/test1.sql.gz'
 
 def test_select_backup_option_configuration_validation_error():
     """Test backup option selection with invalid configuration."""
@@ -40,57 +35,73 @@ def test_select_backup_option_configuration_validation_error():
     
     assert "Export backup directory not configured" in str(exc_info.value)
 
-def test_select_existing_backup_empty_list(mock_ssh, mock_config):
+def test_select_existing_backup_missing_dir(mock_ssh, monkeypatch):
+    """Test selecting an existing backup when the backup directory is missing."""
+    monkeypatch.setattr('mysql_sync_manager.menu.probe_and_list', lambda *a, **k: (False, []))
+    
+    assert select_existing_backup(mock_ssh, '/missing') is None
+
+def test_select_existing_backup_listing_error(mock_ssh, monkeypatch):
+    """Test that a failed listing is raised, not reported as a missing directory."""
+    monkeypatch.setattr('mysql_sync_manager.menu.probe_and_list',
+                        Mock(side_effect=BackupError("listing", "Permission denied")))
+    
+    with pytest.raises(BackupError, match="Permission denied"):
+        select_existing_backup(mock_ssh, '/backup')
+
+def test_select_existing_backup_empty_list(mock_ssh, mock_config, monkeypatch):
     """Test selecting an existing backup when no backups are available."""
-    with patch('ssh.list_remote_backups', return_value=[]):
-        # Update to use the backup directory from mock_config
-        backup_dir = mock_config.get('MYSQL_EXPORT_BACKUP_DIR', '/backup')
-        result = select_existing_backup(mock_ssh, backup_dir)
-        assert result is None
+    monkeypatch.setattr('mysql_sync_manager.menu.probe_and_list', lambda *a, **k: (True, []))
+    # Update to use the backup directory from mock_config
+    backup_dir = mock_config.get('MYSQL_EXPORT_BACKUP_DIR', '/backup')
+    result = select_existing_backup(mock_ssh, backup_dir)
+    assert result is None
 
 
 def test_select_custom_backup_validation(mock_ssh, monkeypatch):
     """Test custom backup path selection with various inputs."""
     # Test back navigation
-    with patch('ssh.check_remote_file', return_value=True), \
-         patch('builtins.input', side_effect=['b']):
-        result = select_custom_backup(mock_ssh)
-        assert result is None
+    monkeypatch.setattr('mysql_sync_manager.menu.check_remote_file', lambda *a, **k: True)
+    _feed_input(monkeypatch, _BACK_INPUT)
+    result = select_custom_backup(mock_ssh)
+    assert result is None
     
     # Test quit
-    with pytest.raises(SystemExit), \
-         patch('builtins.input', side_effect=['q']):
+    _feed_input(monkeypatch, _QUIT_INPUT)
+    with pytest.raises(SystemExit) as exc_info:
         select_custom_backup(mock_ssh)
+    assert exc_info.value.code == 0
     
     # Test invalid path
-    with patch('ssh.check_remote_file', return_value=False), \
-         patch('builtins.input', side_effect=['invalid/path', 'q']):
-        with pytest.raises(SystemExit):
-            select_custom_backup(mock_ssh)
+    monkeypatch.setattr('mysql_sync_manager.menu.check_remote_file', lambda *a, **k: False)
+    _feed_input(monkeypatch, ('invalid/path', 'q'))
+    with pytest.raises(SystemExit) as exc_info:
+        select_custom_backup(mock_ssh)
+    assert exc_info.value.code == 0
 
-def test_select_backup_option_empty_dir(mock_ssh, mock_menu_config):
+def test_select_backup_option_empty_dir(mock_ssh, mock_menu_config, monkeypatch):
     """Test selecting existing backup option when directory is empty"""
     # Simplify the test to just immediately return 'q'
-    with patch('menu.list_remote_backups', return_value=[]), \
-         patch('builtins.print'), \
-         patch('builtins.input', return_value='q'):
-        
-        with pytest.raises(SystemExit):
-            select_backup_option(mock_ssh, mock_menu_config)
+    monkeypatch.setattr('mysql_sync_manager.menu.probe_and_list', lambda *a, **k: (True, []))
+    monkeypatch.setattr('builtins.input', lambda _='': 'q')
+    
+    with pytest.raises(SystemExit) as exc_info:
+        select_backup_option(mock_ssh, mock_menu_config)
+    assert exc_info.value.code == 0
 
-def test_select_backup_option_back_navigation(mock_ssh, mock_menu_config):
+def test_select_backup_option_back_navigation(mock_ssh, mock_menu_config, monkeypatch):
     """Test back navigation from different menu levels."""
-    with patch('menu.list_remote_backups', return_value=[]), \
-         patch('builtins.print'), \
-         patch('builtins.input', side_effect=['b']):
-        result = select_backup_option(mock_ssh, mock_menu_config)
-        assert result == 'back'
+    monkeypatch.setattr('mysql_sync_manager.menu.probe_and_list', lambda *a, **k: (True, []))
+    _feed_input(monkeypatch, _BACK_INPUT)
+    
+    result = select_backup_option(mock_ssh, mock_menu_config)
+    assert result == 'back'
 
-def test_select_backup_option_create_new_failure(mock_ssh, mock_menu_config):
+def test_select_backup_option_create_new_failure(mock_ssh, mock_menu_config, monkeypatch):
     """Test handling failure in create new backup."""
-    with patch('menu.create_new_backup', return_value=None), \
-         patch('builtins.print'), \
-         patch('builtins.input', return_value='q'):
-        
-        with pytest.raises(SystemExit):
-            select_backup_option(mock_ssh, mock_menu_config)
\ No newline at end of file
+    monkeypatch.setattr('mysql_sync_manager.menu.create_new_backup', lambda *a, **k: None)
+    monkeypatch.setattr('builtins.input', lambda _='': 'q')
+    
+    with pytest.raises(SystemExit) as exc_info:
+        select_backup_option(mock_ssh, mock_menu_config)
+    assert exc_info.value.code == 0
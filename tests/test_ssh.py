@@ -2,92 +2,338 @@ import os
 import socket
 import pytest
 import paramiko
+from collections import deque
+from contextlib import nullcontext
+from paramiko import Ed25519Key, SSHClient
 from unittest.mock import Mock, patch
-from mysql_sync_manager.exceptions import SSHConnectionError, ValidationError
+from mysql_sync_manager.exceptions import SSHConnectionError, ValidationError, BackupError
 from mysql_sync_manager.utils import RED, BLUE, GREEN, NC, ICONS
-from mysql_sync_manager.ssh import connect_ssh, check_remote_file, list_remote_backups
-
-@pytest.fixture
-def ssh_config():
-    return {
-        'HOST': 'test-host',
-        'USER': 'test-user',
-        'PASSWORD': 'test-pass',
-        'KEY_PATH': None
-    }
-
-def test_password_auth(ssh_config):
+from mysql_sync_manager import ssh as ssh_module
+from mysql_sync_manager.ssh import _dial
+from mysql_sync_manager.ssh import (
+    connect_ssh, check_remote_file, list_remote_backups, probe_and_list,
+    run_many, execute_remote_command, acquire_ssh, release_ssh, pool_clear
+)
+
+def test_password_auth(ssh_password_config, _mock_network):
     """Test basic password authentication"""
-    with patch('socket.gethostbyname', return_value='1.2.3.4'), \
-         patch('paramiko.SSHClient') as mock_ssh:
-        
-        ssh_client = mock_ssh.return_value
-        result = connect_ssh(ssh_config, {})
-        
-        assert result is not None
-        ssh_client.connect.assert_called_once_with(
-            'test-host', 
-            username='test-user',
-            password='test-pass',
-            timeout=10
-        )
+    ssh_client = _mock_network.return_value
+    result = connect_ssh(ssh_password_config, {})
+    
+    assert result is ssh_client
+    ssh_module._dial.assert_called_once_with([(2, 1, 6, '', ('1.2.3.4', 22))])
+    ssh_client.connect.assert_called_once_with(
+        'test-host', 
+        username='test-user',
+        password='test-pass',
+        sock=ssh_module._dial.return_value,
+        timeout=10
+    )
 
-def test_key_auth(tmp_path, ssh_config):
-    """Test key-based authentication"""
-    key_path = tmp_path / "test_key"
-    key_path.write_text("test key content")
+_KEY = Mock(name="pkey")
 
+@pytest.mark.parametrize("key_side_effect,passphrase_prompts,expect_exc", [
+    pytest.param((_KEY,), 0, None, id="plain"),
+    pytest.param((paramiko.ssh_exception.PasswordRequiredException(), _KEY), 1, None, id="passphrase"),
+    pytest.param((paramiko.ssh_exception.PasswordRequiredException(), paramiko.SSHException("bad passphrase")),
+                 1, "Failed to decrypt SSH key", id="decryption-failure"),
+])
+def test_key_auth(ssh_key_config, _mock_network, monkeypatch,
+                  key_side_effect, passphrase_prompts, expect_exc):
+    """Test key-based authentication, including encrypted keys"""
     mock_stat = Mock(st_mode=0o100600)  # Simulate 600 permissions
-    mock_key = Mock()
-    ssh_config.update({'KEY_PATH': str(key_path), 'PASSWORD': None})
+    mock_input = Mock(return_value="secret")
+    monkeypatch.setattr('builtins.input', mock_input)
+    raises = pytest.raises(SSHConnectionError, match=expect_exc) if expect_exc else nullcontext()
+    result = None
 
-    with patch('os.stat', return_value=mock_stat), \
-         patch('socket.gethostbyname', return_value='1.2.3.4'), \
-         patch('paramiko.SSHClient') as mock_ssh, \
-         patch('paramiko.Ed25519Key.from_private_key_file', return_value=mock_key):
-        
-        result = connect_ssh(ssh_config, {})
-        assert result is not None
+    with patch.object(os, 'stat', return_value=mock_stat), \
+         patch.object(Ed25519Key, 'from_private_key_file', side_effect=key_side_effect), \
+         raises:
+        result = connect_ssh(ssh_key_config, {})
+    
+    assert mock_input.call_count == passphrase_prompts
+    if expect_exc:
+        # Nothing is dialed until the key is usable
+        ssh_module._dial.assert_not_called()
+        _mock_network.return_value.connect.assert_not_called()
+    else:
+        assert result is _mock_network.return_value
+        _mock_network.return_value.connect.assert_called_once_with(
+            'test-host',
+            username='test-user',
+            pkey=_KEY,
+            sock=ssh_module._dial.return_value,
+            timeout=10
+        )
 
-def test_validation_errors(ssh_config):
+@pytest.mark.parametrize("invalid_fields,expected_error", [
+    ({'HOST': ''}, "SSH host is required"),
+    ({'USER': ''}, "SSH user is required"),
+    ({'PASSWORD': None, 'KEY_PATH': None}, "Either password or key path is required"),
+], ids=["no-host", "no-user", "no-credentials"])
+def test_validation_errors(ssh_password_config, _mock_network, invalid_fields, expected_error):
     """Test SSH validation errors"""
-    test_cases = [
-        ({'HOST': ''}, "SSH host is required"),
-        ({'USER': ''}, "SSH user is required"),
-        ({'PASSWORD': None, 'KEY_PATH': None}, "Either password or key path is required"),
-    ]
-
-    for invalid_fields, expected_error in test_cases:
-        test_config = ssh_config.copy()
-        test_config.update(invalid_fields)
-        
-        with pytest.raises(ValidationError, match=expected_error):
-            connect_ssh(test_config, {})
+    test_config = {**ssh_password_config, **invalid_fields}
+    
+    with pytest.raises(ValidationError, match=expected_error):
+        connect_ssh(test_config, {})
+    _mock_network.assert_not_called()
 
-def test_connection_errors(ssh_config):
+@pytest.mark.parametrize("dns_error,sock_error,connect_error,expected_error", [
+    (socket.gaierror, None, None, "Failed to resolve host"),
+    (None, ConnectionRefusedError("Connection refused"), None, "Failed to establish connection"),
+    (None, None, paramiko.AuthenticationException, "Authentication failed"),
+    (None, None, socket.error("Connection reset"), "Failed to establish connection"),
+], ids=["dns", "refused", "auth", "network"])
+def test_connection_errors(ssh_password_config, _mock_network, monkeypatch,
+                           dns_error, sock_error, connect_error, expected_error):
     """Test SSH connection error handling"""
-    with patch('socket.gethostbyname') as mock_dns, \
-         patch('paramiko.SSHClient') as mock_ssh:
-        
-        # Test DNS resolution failure
-        mock_dns.side_effect = socket.gaierror
-        with pytest.raises(SSHConnectionError, match="Failed to resolve host"):
-            connect_ssh(ssh_config, {})
-
-        # Test authentication failure
-        mock_dns.side_effect = None
-        mock_ssh.return_value.connect.side_effect = paramiko.AuthenticationException
-        with pytest.raises(SSHConnectionError, match="Authentication failed"):
-            connect_ssh(ssh_config, {})
-
-def test_list_remote_backups(mock_ssh):
+    if dns_error:
+        monkeypatch.setattr('socket.getaddrinfo', Mock(side_effect=dns_error))
+    ssh_module._dial.side_effect = sock_error
+    _mock_network.return_value.connect.side_effect = connect_error
+    
+    with pytest.raises(SSHConnectionError, match=expected_error):
+        connect_ssh(ssh_password_config, {})
+    if connect_error:
+        ssh_module._dial.return_value.close.assert_called_once()
+
+def test_interrupted_connect_closes_socket(ssh_password_config, _mock_network):
+    """Test that the dialed socket is closed when the handshake is interrupted"""
+    _mock_network.return_value.connect.side_effect = KeyboardInterrupt
+    
+    with pytest.raises(KeyboardInterrupt):
+        connect_ssh(ssh_password_config, {})
+    ssh_module._dial.return_value.close.assert_called_once()
+
+_V6_INFO = (socket.AF_INET6, socket.SOCK_STREAM, 6, '', ('fe80::1', 22, 0, 3))
+_V4_INFO = (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('1.2.3.4', 22))
+
+@pytest.mark.parametrize("refused,expected_addr", [
+    ((), ('fe80::1', 22, 0, 3)),
+    ((0,), ('1.2.3.4', 22)),
+    ((0, 1), None),
+], ids=["first", "fallback-to-ipv4", "all-unreachable"])
+def test_dial(monkeypatch, refused, expected_addr):
+    """Test that every resolved address is tried in order with its full sockaddr"""
+    sockets = []
+    
+    def make_socket(family, socktype, proto):
+        sock = Mock(name=f"sock{len(sockets)}")
+        if len(sockets) in refused:
+            sock.connect.side_effect = ConnectionRefusedError("Connection refused")
+        sockets.append(sock)
+        return sock
+    monkeypatch.setattr('socket.socket', make_socket)
+    
+    if expected_addr is None:
+        with pytest.raises(ConnectionRefusedError):
+            _dial([_V6_INFO, _V4_INFO])
+    else:
+        sock = _dial([_V6_INFO, _V4_INFO])
+        assert sock is sockets[-1]
+        sock.connect.assert_called_once_with(expected_addr)
+        sock.close.assert_not_called()
+    for index in refused:
+        sockets[index].close.assert_called_once()
+
+@pytest.mark.parametrize("skip_host_keys", [False, True], ids=["known-hosts", "skip-host-keys"])
+def test_host_key_loading(ssh_password_config, _mock_network, skip_host_keys):
+    """Test that known_hosts is skipped only when SKIP_HOST_KEYS is set"""
+    connect_ssh({**ssh_password_config, 'SKIP_HOST_KEYS': skip_host_keys}, {})
+    
+    assert _mock_network.return_value.load_system_host_keys.called is not skip_host_keys
+
+def test_dns_cache(ssh_password_config, monkeypatch):
+    """Test that resolved hosts are reused until the TTL expires"""
+    mock_resolve = Mock(return_value=[(2, 1, 6, '', ('1.2.3.4', 22))])
+    clock = Mock(return_value=100.0)
+    monkeypatch.setattr('socket.getaddrinfo', mock_resolve)
+    monkeypatch.setattr('mysql_sync_manager.ssh.time.monotonic', clock)
+    
+    connect_ssh(ssh_password_config, {})
+    connect_ssh(ssh_password_config, {})
+    assert mock_resolve.call_count == 1
+    mock_resolve.assert_called_with('test-host', 22, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    
+    clock.return_value = 100.0 + ssh_module._DNS_TTL + 1
+    connect_ssh(ssh_password_config, {})
+    assert mock_resolve.call_count == 2
+
+@pytest.mark.parametrize("alive,expected_connects", [
+    (True, 1),
+    (False, 2),
+], ids=["reused", "dead-redialed"])
+def test_connection_pool(ssh_password_config, _mock_network, alive, expected_connects):
+    """Test that released clients are reused only while their transport is alive"""
+    first, second = Mock(spec=SSHClient), Mock(spec=SSHClient)
+    _mock_network.side_effect = (first, second)
+    first.get_transport.return_value.is_active.side_effect = (True, alive, True)
+    
+    ssh = acquire_ssh(ssh_password_config, {})
+    assert ssh is first
+    release_ssh(ssh_password_config, ssh)
+    ssh = acquire_ssh(ssh_password_config, {})
+    assert ssh is (first if alive else second)
+    release_ssh(ssh_password_config, ssh)
+    
+    assert _mock_network.call_count == expected_connects
+    assert first.close.called is not alive
+    
+    pool_clear()
+    (first if alive else second).close.assert_called_once()
+
+def test_list_remote_backups(mock_ssh, exec_result):
     """Test listing remote backups"""
-    mock_ssh.exec_command.return_value = (
-        Mock(),
-        Mock(read=lambda: b"-rw-r--r-- 1 user group 1024 Jan 1 12:00 /backup/test.sql.gz"),
-        Mock(read=lambda: b"")
+    mock_ssh.exec_command.return_value = exec_result(
+        b"1024\t1704110400.0\t/backup/test.sql.gz\n"
     )
     
     backups = list_remote_backups(mock_ssh, '/backup')
     assert len(backups) == 1
-    assert backups[0]['name'] == '/backup/test.sql.gz'
\ No newline at end of file
+    assert backups[0]['name'] == '/backup/test.sql.gz'
+    assert backups[0]['size'] == '1.0K'
+    assert "find /backup -maxdepth 1" in mock_ssh.exec_command.call_args[0][0]
+
+@pytest.mark.parametrize("output,expected", [
+    (b"exists", True),
+    (b"not found", False),
+    (b"", False),
+])
+def test_check_remote_file_output(mock_ssh, exec_result, output, expected):
+    """Test remote file check result parsing"""
+    mock_ssh.exec_command.return_value = exec_result(output)
+    
+    assert check_remote_file(mock_ssh, '/backup/test.sql.gz') is expected
+
+@pytest.mark.parametrize("err", [
+    paramiko.SSHException("Channel closed"),
+    IOError("Broken pipe"),
+], ids=["ssh", "io"])
+def test_check_remote_file_errors(mock_ssh, err):
+    """Test remote file check when the command cannot run"""
+    mock_ssh.exec_command.side_effect = err
+    
+    assert check_remote_file(mock_ssh, '/backup/test.sql.gz') is False
+
+@pytest.mark.parametrize("output,exec_error,expected_names", [
+    (b"", None, []),
+    (b"total 0\n", None, []),
+    (b"1024\t1704110400.0\t/backup/a.sql.gz\n"
+     b"2048\t1704196800.0\t/backup/b.tar.gz\n",
+     None, ['/backup/b.tar.gz', '/backup/a.sql.gz']),
+    (b"1024\tnot-a-time\t/backup/a.sql.gz\n", None, []),
+    (b"1024\t1704110400.0\t/backup/caf\xe9.sql.gz\n"
+     b"2048\t1704196800.0\t/backup/b.sql.gz\n",
+     None, ['/backup/caf\ufffd.sql.gz', '/backup/b.sql.gz']),
+    (None, paramiko.SSHException("Channel closed"), []),
+    (None, RuntimeError("unexpected"), []),
+], ids=["empty", "malformed", "sorted", "bad-mtime", "non-utf8-name", "ssh-error", "other-error"])
+def test_list_remote_backups_error_handling(mock_ssh, exec_result, output, exec_error, expected_names):
+    """Test remote backup listing edge cases"""
+    if exec_error:
+        mock_ssh.exec_command.side_effect = exec_error
+    else:
+        mock_ssh.exec_command.return_value = exec_result(output)
+    
+    backups = list_remote_backups(mock_ssh, '/backup')
+    assert [b['name'] for b in backups] == expected_names
+
+@pytest.mark.parametrize("output,exit_status,expected_exists,expected_count", [
+    (b"1024\t1704110400.0\t/backup/a.sql.gz\n", 0, True, 1),
+    (b"", 0, True, 0),
+    (b"", ssh_module._MISSING_DIR_STATUS, False, 0),
+], ids=["with-backups", "empty-dir", "missing-dir"])
+def test_probe_and_list(mock_ssh, exec_result, output, exit_status, expected_exists, expected_count):
+    """Test directory probe and listing in a single remote command"""
+    mock_ssh.exec_command.return_value = exec_result(output, exit_status=exit_status)
+    
+    exists, backups = probe_and_list(mock_ssh, '/backup')
+    
+    assert exists is expected_exists
+    assert len(backups) == expected_count
+    mock_ssh.exec_command.assert_called_once()
+
+@pytest.mark.parametrize("exit_status,exec_error,expected_exc,match", [
+    (1, None, BackupError, "unknown predicate"),
+    (None, paramiko.SSHException("Channel closed"), paramiko.SSHException, "Channel closed"),
+], ids=["find-failure", "ssh-error"])
+def test_probe_and_list_errors(mock_ssh, exec_result, exit_status, exec_error, expected_exc, match):
+    """Test that listing failures are raised rather than reported as a missing directory"""
+    if exec_error:
+        mock_ssh.exec_command.side_effect = exec_error
+    else:
+        mock_ssh.exec_command.return_value = exec_result(
+            stderr=b"find: unknown predicate `-printf'", exit_status=exit_status)
+    
+    with pytest.raises(expected_exc, match=match):
+        probe_and_list(mock_ssh, '/backup')
+
+def _fake_session(events, eof=True):
+    """Build an open_session() stub whose channels echo "<cmd>-ok" in two chunks."""
+    def open_session():
+        channel = Mock(spec=paramiko.Channel, eof_received=eof, closed=not eof)
+        channel.recv_stderr_ready.return_value = False
+        
+        def exec_command(cmd):
+            events.append(('exec', cmd))
+            chunks = deque((f"{cmd}-".encode(), b"ok\n") if eof else ())
+            channel.recv_ready.side_effect = lambda: bool(chunks)
+            channel.recv.side_effect = lambda size: events.append(('read', cmd)) or chunks.popleft()
+        channel.exec_command.side_effect = exec_command
+        return channel
+    return open_session
+
+def test_run_many(mock_ssh, monkeypatch):
+    """Test that a batch starts every command, then reads output as it arrives"""
+    events = []
+    mock_ssh.get_transport.return_value.open_session.side_effect = _fake_session(events)
+    # The most recently started command always finishes first
+    monkeypatch.setattr('mysql_sync_manager.ssh.select.select',
+                        lambda rlist, wlist, xlist, timeout: ([rlist[-1]], [], []))
+    
+    outputs = run_many(mock_ssh, ['a', 'b', 'c'], max_sessions=2)
+    
+    assert outputs == ['a-ok', 'b-ok', 'c-ok']
+    assert events == [('exec', 'a'), ('exec', 'b'), *[('read', 'b')] * 2, *[('read', 'a')] * 2,
+                      ('exec', 'c'), *[('read', 'c')] * 2]
+
+@pytest.mark.parametrize("ready,expect_exc", [
+    (True, None),
+    (False, "No output from remote commands"),
+], ids=["closed-without-eof", "timeout"])
+def test_run_many_stalled_channels(mock_ssh, monkeypatch, ready, expect_exc):
+    """Test that dropped channels and silent batches cannot hang run_many"""
+    mock_ssh.get_transport.return_value.open_session.side_effect = _fake_session([], eof=False)
+    monkeypatch.setattr('mysql_sync_manager.ssh.select.select',
+                        lambda rlist, wlist, xlist, timeout: (list(rlist) if ready else [], [], []))
+    
+    if expect_exc:
+        with pytest.raises(paramiko.SSHException, match=expect_exc):
+            run_many(mock_ssh, ['a', 'b'], timeout=1)
+    else:
+        assert run_many(mock_ssh, ['a', 'b']) == ['', '']
+
+@pytest.mark.parametrize("transport_active", [None, False], ids=["no-transport", "inactive"])
+def test_run_many_disconnected(mock_ssh, transport_active):
+    """Test that run_many refuses to run without a live transport"""
+    if transport_active is None:
+        mock_ssh.get_transport.return_value = None
+    else:
+        mock_ssh.get_transport.return_value.is_active.return_value = transport_active
+    
+    with pytest.raises(paramiko.SSHException, match="not connected"):
+        run_many(mock_ssh, ['a'])
+
+@pytest.mark.parametrize("exit_status,expected", [
+    (0, True),
+    (1, False),
+], ids=["success", "failure"])
+def test_execute_remote_command(mock_ssh, exec_result, exit_status, expected):
+    """Test that stderr is only drained when the command fails"""
+    stdin, stdout, stderr = exec_result(b"", stderr=b"boom", exit_status=exit_status)
+    mock_ssh.exec_command.return_value = (stdin, stdout, stderr)
+    
+    assert execute_remote_command(mock_ssh, 'true') is expected
+    assert stderr.read.called is not expected
@@ -0,0 +1,91 @@
+import io
+import os
+import signal
+import pytest
+from unittest.mock import Mock
+from mysql_sync_manager import utils
+from mysql_sync_manager.utils import format_size, SpinnerProgress, CHECK_ICON, TIMES_ICON, SPINNER_FRAMES
+
+class _FakeStream(io.StringIO):
+    """In-memory stream that reports a configurable isatty() and has no fd."""
+    def __init__(self, tty):
+        super().__init__()
+        self._tty = tty
+
+    def isatty(self):
+        return self._tty
+
+@pytest.mark.parametrize("num_bytes,expected", [
+    (0, "0"),
+    (1023, "1023"),
+    (1024, "1.0K"),
+    (1025, "1.1K"),
+    (10188, "10K"),
+    (10239, "10K"),
+    (10241, "11K"),
+    (1048575, "1.0M"),
+    (1048576, "1.0M"),
+    (5 * 1024 ** 4, "5.0T"),
+])
+def test_format_size(num_bytes, expected):
+    """Test that sizes round up like GNU ls -lh around unit and precision boundaries"""
+    assert format_size(num_bytes) == expected
+
+@pytest.mark.parametrize("tty,success", [
+    (False, True),
+    (False, False),
+    (True, True),
+], ids=["pipe-success", "pipe-failure", "tty"])
+@pytest.mark.timeout(5)
+def test_spinner_progress(monkeypatch, tty, success):
+    """Test that frames are only drawn on a terminal and the status line is always printed"""
+    stderr = _FakeStream(tty)
+    mock_print = Mock()
+    monkeypatch.setattr('sys.stderr', stderr)
+    monkeypatch.setattr('builtins.print', mock_print)
+    
+    spinner = SpinnerProgress("Working 100%")
+    spinner.start()
+    assert (spinner.thread is not None) is tty
+    spinner.stop(success=success)
+    
+    frames = stderr.getvalue()
+    if tty:
+        assert frames.startswith(f"\r{utils.BLUE}{SPINNER_FRAMES[0]}")
+        assert "Working 100%" in frames
+    else:
+        assert frames == ""
+    status_line = mock_print.call_args[0][0]
+    assert (CHECK_ICON if success else TIMES_ICON) in status_line
+    assert "Working 100%" in status_line
+
+@pytest.mark.parametrize("tty,environ,expected", [
+    (True, {}, True),
+    (True, {'NO_COLOR': '1'}, False),
+    (True, {'NO_COLOR': ''}, True),
+    (False, {}, False),
+], ids=["terminal", "no-color", "empty-no-color", "pipe"])
+def test_color_enabled(tty, environ, expected):
+    """Test that colors need a terminal and are turned off by NO_COLOR"""
+    assert utils._color_enabled(_FakeStream(tty), environ) is expected
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGWINCH'), reason="SIGWINCH is POSIX only")
+def test_print_header_resize(monkeypatch):
+    """Test that print_header follows the terminal width after SIGWINCH"""
+    handlers = {}
+    columns = Mock(return_value=os.terminal_size((40, 24)))
+    mock_print = Mock()
+    monkeypatch.setattr(utils, '_TERM_COLS', None)
+    monkeypatch.setattr('shutil.get_terminal_size', columns)
+    monkeypatch.setattr('signal.signal', lambda sig, handler: handlers.__setitem__(sig, handler))
+    monkeypatch.setattr('builtins.print', mock_print)
+    
+    utils.print_header()
+    assert mock_print.call_args_list[0][0][0] == f"{utils.CYAN}{'=' * 40}{utils.NC}"
+    
+    columns.return_value = os.terminal_size((60, 24))
+    handlers[signal.SIGWINCH](signal.SIGWINCH, None)
+    mock_print.reset_mock()
+    utils.print_header()
+    assert mock_print.call_args_list[0][0][0] == f"{utils.CYAN}{'=' * 60}{utils.NC}"
+    assert columns.call_count == 2